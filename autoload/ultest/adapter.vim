@@ -4,6 +4,15 @@ function! ultest#adapter#get_runner(file)
 endfunction
 
 function! ultest#adapter#build_cmd(test) abort
+  return ultest#handler#safe_split(s:BuildCmd(a:test))
+endfunction
+
+" Commands are returned unsplit, the caller is responsible for safe_split
+function! ultest#adapter#build_cmds(tests) abort
+  return map(copy(a:tests), {_, test -> s:BuildCmd(test)})
+endfunction
+
+function! s:BuildCmd(test) abort
   let a:test.file = fnamemodify(a:test.file, get(g:, "test#filename_modifier", ":."))
   call ultest#process#pre(a:test)
   let runner = ultest#adapter#get_runner(a:test.file)
@@ -19,7 +28,6 @@ function! ultest#adapter#build_cmd(test) abort
   if has_key(g:, 'test#transformation')
     let cmd = g:test#custom_transformations[g:test#transformation](cmd)
   endif
-  let cmd = ultest#handler#safe_split(cmd)
   return cmd
 endfunction
 
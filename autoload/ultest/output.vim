@@ -29,6 +29,15 @@ function! ultest#output#open(test) abort
   endif
 endfunction
 
+function! ultest#output#maybe_open(result) abort
+  if type(a:result) != v:t_dict || !get(a:result, "code") | return | endif
+  if expand("%") != a:result.file | return | endif
+  let line = getbufinfo(a:result.file)[0].lnum
+  let nearest = ultest#handler#get_nearest_test(line, a:result.file, v:false)
+  if type(nearest) != v:t_dict || nearest.id != a:result.id | return | endif
+  call ultest#output#open(a:result)
+endfunction
+
 function! ultest#output#attach(test) abort
   if type(a:test) != v:t_dict || empty(a:test) | return | endif
   let attach_res = ultest#handler#get_attach_script(a:test.id)
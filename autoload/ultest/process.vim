@@ -10,6 +10,27 @@ function ultest#process#store_sorted_ids(file, ids) abort
   call setbufvar(a:file, "ultest_sorted_tests", a:ids)
 endfunction
 
+function ultest#process#reset(file) abort
+  call setbufvar(a:file, "ultest_results", {})
+  call setbufvar(a:file, "ultest_tests", {})
+  call setbufvar(a:file, "ultest_sorted_tests", [])
+endfunction
+
+function ultest#process#apply_changes(changes) abort
+  for test in get(a:changes, "moves", [])
+    call ultest#process#move(test)
+  endfor
+  for [test, result] in get(a:changes, "replaces", [])
+    call ultest#process#replace(test, result)
+  endfor
+  for test in get(a:changes, "new", [])
+    call ultest#process#new(test)
+  endfor
+  for test in get(a:changes, "clear", [])
+    call ultest#process#clear(test)
+  endfor
+endfunction
+
 function ultest#process#new(test) abort
   call ultest#process#pre(a:test)
   if index(g:ultest_buffers, a:test.file) == -1
@@ -41,6 +62,12 @@ function ultest#process#start(test) abort
   endfor
 endfunction
 
+function ultest#process#start_many(tests) abort
+  for test in a:tests
+    call ultest#process#start(test)
+  endfor
+endfunction
+
 function ultest#process#move(test) abort
   call ultest#process#pre(a:test)
   let tests = getbufvar(a:test.file, "ultest_tests")
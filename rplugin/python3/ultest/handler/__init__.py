@@ -1,4 +1,6 @@
+import asyncio
 import os
+import re
 from shlex import split
 from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 
@@ -11,6 +13,14 @@ from .finder import TestFinder
 from .processes import ProcessManager
 from .results import ResultStore
 
+# Characters which shlex treats differently to str.split (quotes, escapes and
+# whitespace that shlex doesn't split on)
+SHLEX_CHARS = re.compile(r"[\"'\\\x0b\x0c\x1c-\x1f]|[^\x00-\x7f]")
+
+# Shared defaults for files without stored tests, must never be mutated
+NO_POSITIONS: Tuple[List[int], List[Test]] = ([], [])
+NO_TESTS_BY_ID: Dict[str, Test] = {}
+
 
 class HandlerFactory:
     @staticmethod
@@ -34,20 +44,24 @@ class Handler:
         self._process_manager = process_manager
         self._finder = finder
         self._results = results
-        self._stored_tests: Dict[str, List[Test]] = {}
-        self._prepare_env()
-        self._show_on_run = self._vim.sync_eval("get(g:, 'ultest_output_on_run', 1)")
+        # Sorted test lines and tests stored together so lookups never see a
+        # mix of old and new positions
+        self._stored_positions: Dict[str, Tuple[List[int], List[Test]]] = {}
+        self._stored_tests_by_id: Dict[str, Dict[str, Test]] = {}
+        show_on_run, rows, cols = self._vim.sync_eval(
+            "[get(g:, 'ultest_output_on_run', 1), g:ultest_output_rows, g:ultest_output_cols]"
+        )
+        self._show_on_run = show_on_run
+        self._prepare_env(rows, cols)
         self._vim.log.debug("Handler created")
 
-    def _prepare_env(self):
-        rows = self._vim.sync_eval("g:ultest_output_rows")
+    def _prepare_env(self, rows: int, cols: int):
         if rows:
             self._vim.log.debug(f"Setting ROWS to {rows}")
             os.environ["ROWS"] = str(rows)
         elif "ROWS" in os.environ:
             self._vim.log.debug("Clearing ROWS value")
             os.environ.pop("ROWS")
-        cols = self._vim.sync_eval("g:ultest_output_cols")
         if cols:
             self._vim.log.debug(f"Setting COLUMNS to {cols}")
             os.environ["COLUMNS"] = str(cols)
@@ -57,14 +71,17 @@ class Handler:
 
     def safe_split(self, cmd: Union[str, List[str]]) -> List[str]:
         # Some runner position builders in vim-test don't split args properly (e.g. go test)
-        return split(cmd if isinstance(cmd, str) else " ".join(cmd))
+        cmd_str = cmd if isinstance(cmd, str) else " ".join(cmd)
+        if SHLEX_CHARS.search(cmd_str):
+            return split(cmd_str)
+        return cmd_str.split()
 
     def external_start(self, test_dict: Dict, stdout: str = ""):
         self._vim.log.fdebug(
             "External test {test_dict} registered with stdout {stdout}"
         )
         test = Test(**test_dict)
-        self._register_started(test)
+        self._register_started([test])
         if stdout:
             self._process_manager.register_external_output(test.id, stdout)
 
@@ -77,14 +94,24 @@ class Handler:
 
     def _run_tests(self, tests: Iterable[Test]):
         """
-        Run a list of tests. Each will be done in
-        a separate thread.
+        Run a list of tests. Commands for all tests are built in a single call
+        to Vim before any are marked as started, then each test is run in a
+        separate thread.
         """
-        root = self._vim.sync_call("get", "g:", "test#project_root") or None
-        for test in tests:
-            self._vim.log.fdebug("Sending {test.id} to vim-test")
-            self._register_started(test)
-            cmd = self._vim.sync_call("ultest#adapter#build_cmd", test)
+        tests = list(tests)
+        if not tests:
+            return
+        self._vim.log.fdebug("Sending {[test.id for test in tests]} to vim-test")
+        root, cmds = self._vim.sync_call_many(
+            [
+                ("get", ["g:", "test#project_root"]),
+                ("ultest#adapter#build_cmds", [tests]),
+            ]
+        )
+        root = root or None
+        self._register_started(tests)
+        for test, cmd in zip(tests, cmds):
+            cmd = self.safe_split(cmd)
 
             async def run(cmd=cmd, test=test):
                 result = await self._process_manager.run(cmd, test, cwd=root)
@@ -92,24 +119,22 @@ class Handler:
 
             self._vim.launch(run(), test.id)
 
-    def _register_started(self, test: Test):
-        test.running = 1
-        self._process_manager.register_new_test(test)
-        self._vim.call("ultest#process#start", test)
+    def _register_started(self, tests: List[Test]):
+        for test in tests:
+            test.running = 1
+            self._process_manager.register_new_test(test)
+        self._vim.call("ultest#process#start_many", tests)
 
     def _register_result(self, test: Test, result: Result):
         self._results.add(result.file, result)
         self._vim.call("ultest#process#exit", test, result)
         if self._show_on_run and result.output:
-            self._vim.schedule(self._present_output, result)
+            self._present_output(result)
 
-    def _present_output(self, result):
-        if result.code and self._vim.sync_call("expand", "%") == result.file:
-            self._vim.log.fdebug("Showing {result.id} output")
-            line = self._vim.sync_call("getbufinfo", result.file)[0].get("lnum")
-            nearest = self.get_nearest_test(line, result.file, strict=False)
-            if nearest and nearest.id == result.id:
-                self._vim.sync_call("ultest#output#open", result.dict())
+    def _present_output(self, result: Result):
+        if result.code:
+            self._vim.log.fdebug("Requesting output display for {result.id}")
+            self._vim.call("ultest#output#maybe_open", result)
 
     def run_all(self, file_name: str, update_empty: bool = True):
         """
@@ -119,7 +144,7 @@ class Handler:
         """
 
         self._vim.log.finfo("Running all tests in {file_name}")
-        tests = self._stored_tests.get(file_name, [])
+        _, tests = self._stored_positions.get(file_name, NO_POSITIONS)
 
         if not tests and update_empty:
             self._vim.log.finfo(
@@ -142,7 +167,7 @@ class Handler:
         """
 
         self._vim.log.finfo("Running nearest test in {file_name} at line {line}")
-        tests = self._stored_tests.get(file_name, [])
+        _, tests = self._stored_positions.get(file_name, NO_POSITIONS)
 
         if not tests and update_empty:
             self._vim.log.finfo(
@@ -156,10 +181,10 @@ class Handler:
 
             return self.update_positions(file_name, callback=run_after_update)
 
-        test = self._finder.get_nearest_from(line, tests, strict=False)
+        test = self.get_nearest_test(line, file_name, strict=False)
         if test:
             self._vim.log.finfo("Nearest test found is {test.id}")
-            self._run_tests([test])  # type: ignore
+            self._run_tests([test])
 
     def run_single(self, test_id: str, file_name: str):
         """
@@ -169,8 +194,9 @@ class Handler:
         :param file_name: File to run in.
         """
         self._vim.log.finfo("Running test {test_id} in {file_name}")
-        tests = self._stored_tests.get(file_name, [])
-        self._run_tests([test for test in tests if test.id == test_id])
+        test = self._stored_tests_by_id.get(file_name, NO_TESTS_BY_ID).get(test_id)
+        if test:
+            self._run_tests([test])
 
     def update_positions(self, file_name: str, callback: Optional[Callable] = None):
         """
@@ -179,64 +205,82 @@ class Handler:
         :param file_name: Name of file to clear results from.
         """
 
-        if not os.path.isfile(file_name):
-            return
-        try:
-            vim_patterns = self._vim.sync_call("ultest#adapter#get_patterns", file_name)
-        except Exception:
-            self._vim.log.exception(
-                f"Error whilte evaluating patterns for file {file_name}"
-            )
-            return
-        if not vim_patterns:
-            self._vim.log.fdebug("No patterns found for {file_name}")
-            return
-
-        recorded_tests = {
-            test.id: test for test in self._stored_tests.get(file_name, [])
-        }
-        if not recorded_tests:
-            self._vim.call("setbufvar", file_name, "ultest_results", {})
-            self._vim.call("setbufvar", file_name, "ultest_tests", {})
-            self._vim.call("setbufvar", file_name, "ultest_sorted_tests", [])
-
         async def runner():
+            loop = asyncio.get_running_loop()
+            if not await loop.run_in_executor(None, os.path.isfile, file_name):
+                return
+            try:
+                vim_patterns = await self._vim.await_call(
+                    "ultest#adapter#get_patterns", file_name
+                )
+            except Exception:
+                self._vim.log.exception(
+                    f"Error whilte evaluating patterns for file {file_name}"
+                )
+                return
+            if not vim_patterns:
+                self._vim.log.fdebug("No patterns found for {file_name}")
+                return
+
             self._vim.log.finfo("Updating positions in {file_name}")
             tests = await self._finder.find_all(file_name, vim_patterns)
-            self._stored_tests[file_name] = tests
+            # Read after awaiting so overlapping updates diff against the
+            # latest stored positions
+            recorded_tests = self._stored_tests_by_id.get(file_name, NO_TESTS_BY_ID)
+            if not recorded_tests:
+                self._vim.call("ultest#process#reset", file_name)
+            tests_by_id = {test.id: test for test in tests}
+            self._stored_positions[file_name] = ([test.line for test in tests], tests)
+            self._stored_tests_by_id[file_name] = tests_by_id
             self._vim.call(
                 "ultest#process#store_sorted_ids",
                 file_name,
                 [test.id for test in tests],
             )
+            moves: List[Test] = []
+            replaces: List[List] = []
+            new: List[Test] = []
             for test in tests:
-                if test.id in recorded_tests:
-                    recorded = recorded_tests.pop(test.id)
+                recorded = recorded_tests.get(test.id)
+                if recorded:
                     if recorded.line != test.line:
                         test.running = self._process_manager.is_running(test.id)
                         self._vim.log.fdebug(
                             "Moving test {test.id} from {recorded.line} to {test.line} in {file_name}"
                         )
-                        self._vim.call("ultest#process#move", test)
+                        moves.append(test)
                 else:
                     existing_result = self._results.get(test.file, test.id)
                     if existing_result:
                         self._vim.log.fdebug(
                             "Replacing test {test.id} to {test.line} in {file_name}"
                         )
-                        self._vim.call("ultest#process#replace", test, existing_result)
+                        replaces.append([test, existing_result])
                     else:
                         self._vim.log.fdebug("New test {test.id} found in {file_name}")
-                        self._vim.call("ultest#process#new", test)
-
-            if recorded_tests:
+                        new.append(test)
+
+            removed_tests = [
+                recorded
+                for test_id, recorded in recorded_tests.items()
+                if test_id not in tests_by_id
+            ]
+            if removed_tests:
                 self._vim.log.fdebug(
-                    "Removing tests {[recorded.id for recorded in recorded_tests]} from {file_name}"
+                    "Removing tests {[removed.id for removed in removed_tests]} from {file_name}"
                 )
-                for removed in recorded_tests.values():
-                    self._vim.call("ultest#process#clear", removed)
             else:
                 self._vim.log.fdebug("No tests removed")
+            if moves or replaces or new or removed_tests:
+                self._vim.call(
+                    "ultest#process#apply_changes",
+                    {
+                        "moves": moves,
+                        "replaces": replaces,
+                        "new": new,
+                        "clear": removed_tests,
+                    },
+                )
             self._vim.command("doau User UltestPositionsUpdate")
             if callback:
                 callback()
@@ -246,9 +290,10 @@ class Handler:
     def get_nearest_test(
         self, line: int, file_name: str, strict: bool
     ) -> Optional[Test]:
-        tests = self._stored_tests.get(file_name, [])
-        test = self._finder.get_nearest_from(line, tests, strict)
-        return test
+        lines, tests = self._stored_positions.get(file_name, NO_POSITIONS)
+        if not tests:
+            return None
+        return self._finder.get_nearest_sorted(line, lines, tests, strict)
 
     def get_nearest_test_dict(
         self, line: int, file_name: str, strict: bool
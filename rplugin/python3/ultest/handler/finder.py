@@ -1,4 +1,5 @@
 import re
+from bisect import bisect_right
 from typing import Dict, List, Optional
 
 from ..models import Test
@@ -18,25 +19,24 @@ class TestFinder:
             lines = test_file.readlines()
         return self._calculate_tests(file_name, patterns, lines)
 
-    def get_nearest_from(
-        self, line: int, tests: List[Test], strict: bool = False
+    def get_nearest_sorted(
+        self, line: int, lines: List[int], tests: List[Test], strict: bool = False
     ) -> Optional[Test]:
-        if not tests:
+        """
+        Find the last test starting at or before a line.
+
+        :param line: Line to search from.
+        :param lines: Sorted start lines of the tests.
+        :param tests: Tests in the same order as lines.
+        :param strict: Only match a test starting on the line.
+        """
+        index = bisect_right(lines, line) - 1
+        if index < 0:
             return None
-        l = 0
-        r = len(tests) - 1
-        while l <= r:
-            m = int((l + r) / 2)
-            mid = tests[m]
-            if mid.line < line:
-                l = m + 1
-            elif mid.line > line:
-                r = m - 1
-            else:
-                return mid
-        return (
-            tests[r] if not strict and len(tests) > r and tests[r].line < line else None
-        )
+        test = tests[index]
+        if strict and test.line != line:
+            return None
+        return test
 
     def _convert_patterns(self, vim_patterns: Dict[str, List[str]]):
         return [
@@ -112,16 +112,20 @@ class ProcessManager:
         :rtype: Result
         """
 
-        self._create_test_file_dir(test.file)
-        stdin_path = self.stdin_name(test)
-        stdout_path = self.stdout_name(test)
-        test_process = TestProcess(
-            in_path=stdin_path, out_path=stdout_path, logger=self._vim.log
-        )
-        self._processes[test.id] = test_process
-        self._vim.log.fdebug("Starting test process {test.id} with command: {cmd}")
         try:
+            # Create the FIFO only once a worker is free, so queueing many
+            # tests doesn't create one for each up front
             async with self._vim.semaphore:
+                self._create_test_file_dir(test.file)
+                stdin_path = self.stdin_name(test)
+                stdout_path = self.stdout_name(test)
+                test_process = TestProcess(
+                    in_path=stdin_path, out_path=stdout_path, logger=self._vim.log
+                )
+                self._processes[test.id] = test_process
+                self._vim.log.fdebug(
+                    "Starting test process {test.id} with command: {cmd}"
+                )
                 with test_process.open() as (in_handle, out_handle):
                     try:
                         process = await subprocess.create_subprocess_exec(
@@ -150,7 +154,7 @@ class ProcessManager:
                     )
                     return result
         finally:
-            del self._processes[test.id]
+            self._processes.pop(test.id, None)
 
     def register_new_test(self, test: Test):
         self._processes[test.id] = None
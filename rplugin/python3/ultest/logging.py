@@ -1,9 +1,16 @@
+import inspect
 import logging
 import os
 import tempfile
+from functools import lru_cache
 from logging import handlers
 
 
+@lru_cache(maxsize=None)
+def _compile_fstring(fstr: str):
+    return compile('f"' + fstr + '"', "<fstring>", "eval")
+
+
 class UltestLogger(logging.Logger):
     def fdebug(self, fstr, *args):
         """
@@ -45,8 +52,6 @@ class UltestLogger(logging.Logger):
     def __deferred_flog(self, fstr, level, *args):
         if self.isEnabledFor(level):
             try:
-                import inspect
-
                 frame = inspect.currentframe().f_back.f_back
                 code = frame.f_code
                 extra = {
@@ -54,10 +59,8 @@ class UltestLogger(logging.Logger):
                     "funcName": code.co_name,
                     "lineno": frame.f_lineno,
                 }
-                fstr = 'f"' + fstr + '"'
-                self.log(
-                    level, eval(fstr, frame.f_globals, frame.f_locals), extra=extra
-                )
+                message = eval(_compile_fstring(fstr), frame.f_globals, frame.f_locals)
+                self.log(level, message, extra=extra)
             except Exception as e:
                 self.error(f"Error {e} converting args to str {fstr}")
 
@@ -0,0 +1,40 @@
+from typing import Any, Dict
+
+from .encoding import dumps
+
+
+class Model:
+    """
+    Base for models which are sent to Vim. dict() and repr are cached until
+    the value of _cache_key() changes, so the dict must not be mutated.
+    """
+
+    __slots__ = ("_dict_cache", "_repr_cache")
+
+    def _cache_key(self) -> Any:
+        return None
+
+    def _build_dict(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def _build_repr(self) -> str:
+        return dumps(self.dict())
+
+    def __str__(self):
+        return self.__repr__()
+
+    def __repr__(self):
+        key = self._cache_key()
+        cached = getattr(self, "_repr_cache", None)
+        if cached is None or cached[0] != key:
+            cached = (key, self._build_repr())
+            self._repr_cache = cached
+        return cached[1]
+
+    def dict(self) -> Dict[str, Any]:
+        key = self._cache_key()
+        cached = getattr(self, "_dict_cache", None)
+        if cached is None or cached[0] != key:
+            cached = (key, self._build_dict())
+            self._dict_cache = cached
+        return cached[1]
@@ -1,21 +1,22 @@
-import json
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
+
+from .base import Model
 
 
 @dataclass(repr=False)
-class Result:
+class Result(Model):
+
+    __slots__ = ("id", "file", "code", "output")
 
     id: str
     file: str
     code: int
     output: str
 
-    def __str__(self):
-        return self.__repr__()
-
-    def __repr__(self):
-        props = self.dict()
-        return json.dumps(props)
-
-    def dict(self):
-        return asdict(self)
+    def _build_dict(self):
+        return {
+            "id": self.id,
+            "file": self.file,
+            "code": self.code,
+            "output": self.output,
+        }
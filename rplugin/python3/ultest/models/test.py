@@ -1,9 +1,13 @@
-import json
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
+
+from .base import Model
+from .encoding import dumps
 
 
 @dataclass(repr=False)
-class Test:
+class Test(Model):
+
+    __slots__ = ("id", "name", "file", "line", "col", "running")
 
     id: str
     name: str
@@ -12,13 +16,19 @@ class Test:
     col: int
     running: int
 
-    def __str__(self):
-        return self.__repr__()
+    def _cache_key(self):
+        # Only running changes after construction
+        return self.running
 
-    def __repr__(self):
-        props = self.dict()
-        props["name"] = [int(char) for char in self.name.encode()]
-        return json.dumps(props)
+    def _build_repr(self):
+        return dumps({**self.dict(), "name": list(self.name.encode())})
 
-    def dict(self):
-        return asdict(self)
+    def _build_dict(self):
+        return {
+            "id": self.id,
+            "name": self.name,
+            "file": self.file,
+            "line": self.line,
+            "col": self.col,
+            "running": self.running,
+        }
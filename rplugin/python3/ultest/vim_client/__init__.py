@@ -1,4 +1,5 @@
-from typing import Any, Callable, Coroutine, List
+import asyncio
+from typing import Any, Callable, Coroutine, Iterable, List, Tuple
 
 from pynvim import Nvim
 
@@ -126,6 +127,46 @@ class VimClient:
         expr = self.construct_function(func, *args)
         return self._eval(expr, sync=True)
 
+    async def await_call(self, func: str, *args) -> Any:
+        """
+        Call a vimscript function on the main Vim thread and wait for the
+        result without blocking the calling event loop.
+
+        :param func: Name of function to call.
+        :param args: Arguments for the function.
+        :return: Result of function call.
+        :rtype: Any
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def resolve(setter, value):
+            if not future.done():
+                setter(value)
+
+        def runner():
+            try:
+                result = self.sync_call(func, *args)
+            except Exception as e:
+                loop.call_soon_threadsafe(resolve, future.set_exception, e)
+            else:
+                loop.call_soon_threadsafe(resolve, future.set_result, result)
+
+        self.schedule(runner)
+        return await future
+
+    def sync_call_many(self, calls: Iterable[Tuple[str, List]]) -> List[Any]:
+        """
+        Call several vimscript functions from the main Vim thread in a single
+        request. Functions are called in the order given.
+
+        :param calls: Pairs of function name and list of arguments.
+        :return: Results of each function call.
+        :rtype: List[Any]
+        """
+        expr = self.construct_functions(calls)
+        return self._eval(expr, sync=True)
+
     def eval(self, expr: str) -> Any:
         return self._eval(expr, sync=False)
 
@@ -136,6 +177,10 @@ class VimClient:
         func_args = ", ".join(self._convert_arg(arg) for arg in args)
         return f"{func}({func_args})"
 
+    def construct_functions(self, calls: Iterable[Tuple[str, List]]):
+        funcs = ", ".join(self.construct_function(func, *args) for func, args in calls)
+        return f"[{funcs}]"
+
     def _eval(self, expr: str, sync: bool):
         return self._vim.eval(expr, async_=not sync)
 
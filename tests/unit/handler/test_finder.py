@@ -27,38 +27,46 @@ def sorted_tests(
     ).map(lambda tests: sorted(tests, key=lambda test: test.line))
 
 
+def lines(tests: List[Test]) -> List[int]:
+    return [test.line for test in tests]
+
+
 vim = Mock()
 vim.launch = lambda f, _: f()
 finder = TestFinder(vim)
 
 
 @given(sorted_tests())
-def test_get_nearest_from_strict_match(tests: List[Test]):
+def test_get_nearest_sorted_strict_match(tests: List[Test]):
     test_i = int(random.random() * len(tests))
     expected = tests[test_i]
-    result = finder.get_nearest_from(expected.line, tests, strict=True)
+    result = finder.get_nearest_sorted(expected.line, lines(tests), tests, strict=True)
     assert expected == result
 
 
 @given(sorted_tests())
-def test_get_nearest_from_strict_no_match(tests: List[Test]):
+def test_get_nearest_sorted_strict_no_match(tests: List[Test]):
     test_i = int(random.random() * len(tests))
-    result = finder.get_nearest_from(tests[test_i].line + 1, tests, strict=True)
+    result = finder.get_nearest_sorted(
+        tests[test_i].line + 1, lines(tests), tests, strict=True
+    )
     assert result is None
 
 
 @given(sorted_tests())
-def test_get_nearest_from_non_strict_match(tests: List[Test]):
+def test_get_nearest_sorted_non_strict_match(tests: List[Test]):
     test_i = int(random.random() * len(tests))
     expected = tests[test_i]
-    result = finder.get_nearest_from(expected.line + 1, tests, strict=False)
+    result = finder.get_nearest_sorted(
+        expected.line + 1, lines(tests), tests, strict=False
+    )
     assert expected == result
 
 
 @given(sorted_tests(min_line=20))
-def test_get_nearest_from_non_strict_no_match(tests: List[Test]):
+def test_get_nearest_sorted_non_strict_no_match(tests: List[Test]):
     line = 10
-    result = finder.get_nearest_from(line, tests, strict=False)
+    result = finder.get_nearest_sorted(line, lines(tests), tests, strict=False)
     assert result is None
 
 
@@ -0,0 +1,42 @@
+from shlex import split
+from unittest.mock import Mock
+
+from hypothesis import assume, given
+from hypothesis.strategies import characters, lists, sampled_from, text
+
+from rplugin.python3.ultest.handler import Handler
+
+vim = Mock()
+vim.sync_eval.return_value = [1, 0, 0]
+handler = Handler(vim, Mock(), Mock(), Mock())
+
+
+def shlex_split(cmd: str):
+    try:
+        return split(cmd)
+    except ValueError:
+        assume(False)
+
+
+@given(text())
+def test_safe_split_matches_shlex(cmd: str):
+    expected = shlex_split(cmd)
+    assert handler.safe_split(cmd) == expected
+
+
+@given(text(alphabet=" \t\r\n\x0b\x0c\x1c\x1d\x1e\x1f\x85\xa0　ab\"'\\"))
+def test_safe_split_matches_shlex_special_chars(cmd: str):
+    expected = shlex_split(cmd)
+    assert handler.safe_split(cmd) == expected
+
+
+@given(lists(text(alphabet=characters(blacklist_categories=["Cs"]))))
+def test_safe_split_joins_lists(cmd):
+    expected = shlex_split(" ".join(cmd))
+    assert handler.safe_split(cmd) == expected
+
+
+@given(lists(sampled_from(["go", "test", "-run", "'^TestA$'", "a b", "é"])))
+def test_safe_split_common_commands(cmd):
+    expected = shlex_split(" ".join(cmd))
+    assert handler.safe_split(cmd) == expected
@@ -0,0 +1,35 @@
+import json
+from dataclasses import dataclass
+
+from rplugin.python3.ultest.models.base import Model
+
+
+@dataclass(repr=False)
+class Counter(Model):
+
+    __slots__ = ("key", "builds")
+
+    key: int
+    builds: int
+
+    def _cache_key(self):
+        return self.key
+
+    def _build_dict(self):
+        self.builds += 1
+        return {"key": self.key}
+
+
+def test_output_cached():
+    model = Counter(key=1, builds=0)
+    assert model.dict() is model.dict()
+    assert repr(model) == repr(model) == str(model)
+    assert model.builds == 1
+
+
+def test_output_rebuilt_on_key_change():
+    model = Counter(key=1, builds=0)
+    assert json.loads(repr(model)) == {"key": 1}
+    model.key = 2
+    assert model.dict() == {"key": 2}
+    assert json.loads(repr(model)) == {"key": 2}
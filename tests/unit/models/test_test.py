@@ -0,0 +1,16 @@
+import json
+
+from rplugin.python3.ultest.models.test import Test
+
+
+def test_repr_encodes_name():
+    test = Test(id="test_é", name="test_é", file="a.py", line=1, col=1, running=0)
+    assert json.loads(repr(test))["name"] == list("test_é".encode())
+
+
+def test_output_updated_on_running_change():
+    test = Test(id="test_a", name="test_a", file="a.py", line=1, col=1, running=0)
+    assert json.loads(repr(test))["running"] == 0
+    test.running = 1
+    assert test.dict()["running"] == 1
+    assert json.loads(repr(test))["running"] == 1
@@ -0,0 +1,29 @@
+import logging
+from unittest.mock import Mock
+
+from rplugin.python3.ultest.logging import UltestLogger
+
+
+def test_fdebug_formats_locals():
+    logger = UltestLogger(name="test")
+    logger.setLevel(logging.DEBUG)
+    handler = Mock(level=logging.DEBUG)
+    logger.addHandler(handler)
+    test_id = "test_a"
+    logger.fdebug("Running {test_id}")
+    assert handler.handle.call_args[0][0].getMessage() == "Running test_a"
+
+
+def test_fdebug_not_evaluated_when_disabled():
+    logger = UltestLogger(name="test")
+    logger.setLevel(logging.INFO)
+    formatted = []
+
+    class Test:
+        def __format__(self, spec):
+            formatted.append(self)
+            return ""
+
+    test = Test()
+    logger.fdebug("Running {test}")
+    assert not formatted